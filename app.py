@@ -10,18 +10,61 @@ This application allows users to:
 - Switch between different task lists seamlessly
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, abort, render_template, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel, Field, ValidationError, conlist, constr
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import QueuePool
 from datetime import datetime
+from typing import Annotated, Literal, Optional, Union
+import click
+import hashlib
 import os
+import orjson
+
+# Bound once at import so write endpoints skip the attribute lookup
+utcnow = datetime.utcnow
+
+# Naive datetimes are stored in UTC, so serialize them with a 'Z' suffix
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson, which serializes datetimes natively.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configuration
+# python app.py runs the development server in debug mode unless FLASK_DEBUG says otherwise.
+# Set here, before the models are defined, because the task relationship reads it.
+if __name__ == '__main__' and 'FLASK_DEBUG' not in os.environ:
+    app.debug = True
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///task_tracker.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'poolclass': QueuePool,
+    'pool_pre_ping': True,
+    'pool_recycle': 3600,
+    'pool_size': 10,
+    'max_overflow': 20,
+    # Pooled SQLite connections are handed out across request threads
+    'connect_args': {'check_same_thread': False},
+}
 
 # Initialize SQLAlchemy
 db = SQLAlchemy(app)
@@ -37,9 +80,11 @@ class TaskList(db.Model):
     name = db.Column(db.String(100), nullable=False, unique=True)
     description = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=True)
     
-    tasks = db.relationship('Task', backref='task_list', lazy=True, cascade='all, delete-orphan')
+    # In debug mode any unplanned lazy load raises, so N+1 queries surface immediately
+    tasks = db.relationship('Task', back_populates='task_list', cascade='all, delete-orphan',
+                            lazy='raise' if app.debug else 'select')
     
     def __repr__(self):
         return f'<TaskList {self.name}>'
@@ -49,21 +94,232 @@ class Task(db.Model):
     Task model representing an individual task item.
     """
     __tablename__ = 'tasks'
+    __table_args__ = (
+        db.Index('ix_tasks_list_completed', 'task_list_id', 'completed'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
     completed = db.Column(db.Boolean, default=False, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=True)
-    task_list_id = db.Column(db.Integer, db.ForeignKey('task_lists.id'), nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=True)
+    task_list_id = db.Column(db.Integer, db.ForeignKey('task_lists.id'), nullable=False, index=True)
+    
+    task_list = db.relationship('TaskList', back_populates='tasks')
     
     def __repr__(self):
         return f'<Task {self.title}>'
 
-# Create database tables
+# Request schemas, validated straight from the raw request body
+class TaskListIn(BaseModel):
+    """
+    Payload for creating or updating a task list.
+    """
+    name: constr(strip_whitespace=True, min_length=1, max_length=100)
+    description: constr(strip_whitespace=True) = ''
+
+class TaskIn(BaseModel):
+    """
+    Payload for creating a task.
+    """
+    title: constr(strip_whitespace=True, min_length=1, max_length=200)
+    description: constr(strip_whitespace=True) = ''
+
+# Upper bound on rows a single bulk request may insert
+MAX_BULK_TASKS = 500
+
+class TaskBulkIn(BaseModel):
+    """
+    Payload for creating many tasks at once.
+    """
+    tasks: conlist(TaskIn, min_length=1, max_length=MAX_BULK_TASKS)
+
+class TaskUpdateIn(BaseModel):
+    """
+    Payload for updating a task; omitted fields are left unchanged.
+    """
+    title: Optional[constr(strip_whitespace=True, min_length=1, max_length=200)] = None
+    description: Optional[constr(strip_whitespace=True)] = None
+    completed: Optional[bool] = None
+
+class ToggleOp(BaseModel):
+    """
+    Batch operation flipping a task's completion status.
+    """
+    op: Literal['toggle']
+    task_id: int
+
+class UpdateOp(TaskUpdateIn):
+    """
+    Batch operation updating a task's fields.
+    """
+    op: Literal['update']
+    task_id: int
+
+# Upper bound on operations in one batch, which holds the write lock until it commits
+MAX_BATCH_OPS = 500
+
+BatchOp = Annotated[Union[ToggleOp, UpdateOp], Field(discriminator='op')]
+
+class BatchIn(BaseModel):
+    """
+    Payload for applying several task operations in one transaction.
+    """
+    ops: conlist(BatchOp, min_length=1, max_length=MAX_BATCH_OPS)
+
+def validation_error(error):
+    """
+    Turn the first pydantic validation error into the API's error response.
+    """
+    detail = error.errors()[0]
+    field = '.'.join(str(part) for part in detail['loc'])
+    message = f"{field}: {detail['msg']}" if field else detail['msg']
+    return jsonify({'error': message}), 400
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune every new SQLite connection: WAL lets readers proceed during writes,
+    and synchronous=NORMAL avoids a full fsync on each commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-65536')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.close()
+
 with app.app_context():
+    event.listen(db.engine, 'connect', set_sqlite_pragmas)
+
+def init_db():
+    """
+    Create database tables and indexes.
+    Kept out of import time so serving workers skip schema introspection.
+    """
     db.create_all()
+    # create_all() skips existing tables, so add indexes missing from older databases
+    for index in Task.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+
+@app.cli.command('init-db')
+def init_db_command():
+    """
+    Create database tables: flask --app app init-db
+    """
+    init_db()
+    click.echo('Initialized the database.')
+
+def compute_etag():
+    """
+    Build a weak ETag for the whole task list collection.
+    Combines the latest update time and row count of both tables so that
+    creates, edits and deletes all produce a new tag.
+    """
+    state = db.session.execute(db.select(
+        db.select(db.func.max(TaskList.updated_at)).scalar_subquery(),
+        db.select(db.func.count(TaskList.id)).scalar_subquery(),
+        db.select(db.func.max(Task.updated_at)).scalar_subquery(),
+        db.select(db.func.count(Task.id)).scalar_subquery(),
+    )).one()
+    return hashlib.blake2b(repr(tuple(state)).encode(), digest_size=8).hexdigest()
+
+def not_modified(etag):
+    """
+    Return a 304 response if the client's cached copy matches the ETag.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+def name_taken(name, exclude_id=None):
+    """
+    Check whether a task list name is already used, optionally ignoring one list.
+    Uses an EXISTS query so no TaskList row is loaded.
+    """
+    condition = TaskList.name == name
+    if exclude_id is not None:
+        condition = condition & (TaskList.id != exclude_id)
+    return db.session.scalar(db.select(db.exists().where(condition)))
+
+def iter_all_lists(full=False):
+    """
+    Yield the JSON for all task lists in chunks, one task list at a time.
+    Task descriptions are only loaded and included when full is True.
+    Task rows are fetched in batches in task list order, so only one list's
+    tasks are held in memory at a time.
+    """
+    task_columns = [Task.id, Task.title, Task.completed, Task.created_at, Task.updated_at, Task.task_list_id]
+    if full:
+        task_columns.append(Task.description)
+    
+    # Plain Core rows: two queries total and no ORM object hydration
+    list_rows = db.session.execute(
+        db.select(TaskList.id, TaskList.name, TaskList.description, TaskList.created_at)
+        .order_by(TaskList.id)
+    ).all()
+    task_rows = iter(db.session.execute(
+        db.select(*task_columns)
+        .order_by(Task.task_list_id, Task.id)
+        .execution_options(yield_per=100)
+    ))
+    task = next(task_rows, None)
+    
+    yield b'['
+    for position, task_list in enumerate(list_rows):
+        tasks = []
+        # Rows for lists not in list_rows (created between the two queries) are skipped
+        while task is not None and task.task_list_id <= task_list.id:
+            if task.task_list_id == task_list.id:
+                task_data = {
+                    'id': task.id,
+                    'title': task.title,
+                    'completed': task.completed,
+                    'created_at': task.created_at,
+                    'updated_at': task.updated_at
+                }
+                if full:
+                    task_data['description'] = task.description
+                tasks.append(task_data)
+            task = next(task_rows, None)
+        
+        if position:
+            yield b','
+        yield orjson.dumps({
+            'id': task_list.id,
+            'name': task_list.name,
+            'description': task_list.description,
+            'created_at': task_list.created_at,
+            'tasks': tasks
+        }, option=ORJSON_OPTIONS)
+    yield b']'
+
+# Rendered task list bodies keyed by the fields flag, stored as (etag, body).
+# The ETag is read from the database on every request, so writes from any
+# process or thread invalidate an entry.
+rendered_lists = {}
+
+# Bodies larger than this are only streamed, never held in the cache
+MAX_CACHED_BODY = 1024 * 1024
+
+def stream_all_lists(etag, full=False):
+    """
+    Stream the task list JSON to the client, caching the body if it is small.
+    """
+    chunks = []
+    size = 0
+    for chunk in iter_all_lists(full):
+        yield chunk
+        if chunks is not None:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_CACHED_BODY:
+                chunks = None
+    if chunks is not None:
+        rendered_lists[full] = (etag, b''.join(chunks))
 
 @app.route('/')
 def index():
@@ -71,39 +327,30 @@ def index():
     Main route - displays the task tracker interface.
     Shows all task lists and allows switching between them.
     """
-    task_lists = TaskList.query.all()
-    return render_template('index.html', task_lists=task_lists)
+    return render_template('index.html')
 
 @app.route('/api/task-lists', methods=['GET'])
 def get_task_lists():
     """
     API endpoint to get all task lists.
     Returns JSON data for all task lists with their associated tasks.
+    Task descriptions are omitted unless the request passes '?fields=full'.
     """
-    task_lists = TaskList.query.all()
-    result = []
-    
-    for task_list in task_lists:
-        tasks = []
-        for task in task_list.tasks:
-            tasks.append({
-                'id': task.id,
-                'title': task.title,
-                'description': task.description,
-                'completed': task.completed,
-                'created_at': task.created_at.isoformat(),
-                'updated_at': task.updated_at.isoformat() if task.updated_at else None
-            })
-        
-        result.append({
-            'id': task_list.id,
-            'name': task_list.name,
-            'description': task_list.description,
-            'created_at': task_list.created_at.isoformat(),
-            'tasks': tasks
-        })
-    
-    return jsonify(result)
+    etag = compute_etag()
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    
+    full = request.args.get('fields') == 'full'
+    cached_body = rendered_lists.get(full)
+    if cached_body and cached_body[0] == etag:
+        body = cached_body[1]
+    else:
+        body = stream_with_context(stream_all_lists(etag, full))
+    
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    return response
 
 @app.route('/api/task-lists', methods=['POST'])
 def create_task_list():
@@ -111,25 +358,18 @@ def create_task_list():
     API endpoint to create a new task list.
     Expects JSON data with 'name' and optional 'description'.
     """
-    data = request.get_json()
-    
-    if not data or 'name' not in data:
-        return jsonify({'error': 'Task list name is required'}), 400
-    
-    name = data['name'].strip()
-    if not name:
-        return jsonify({'error': 'Task list name cannot be empty'}), 400
+    try:
+        payload = TaskListIn.model_validate_json(request.get_data())
+    except ValidationError as error:
+        return validation_error(error)
     
     # Check if task list with same name already exists
-    existing_list = TaskList.query.filter_by(name=name).first()
-    if existing_list:
+    if name_taken(payload.name):
         return jsonify({'error': 'Task list with this name already exists'}), 400
     
-    description = data.get('description', '').strip()
-    
     new_task_list = TaskList()
-    new_task_list.name = name
-    new_task_list.description = description
+    new_task_list.name = payload.name
+    new_task_list.description = payload.description
     db.session.add(new_task_list)
     db.session.commit()
     
@@ -137,7 +377,7 @@ def create_task_list():
         'id': new_task_list.id,
         'name': new_task_list.name,
         'description': new_task_list.description,
-        'created_at': new_task_list.created_at.isoformat(),
+        'created_at': new_task_list.created_at,
         'tasks': []
     }), 201
 
@@ -147,24 +387,19 @@ def update_task_list(list_id):
     API endpoint to update an existing task list.
     Expects JSON data with 'name' and optional 'description'.
     """
-    task_list = TaskList.query.get_or_404(list_id)
-    data = request.get_json()
-    
-    if not data or 'name' not in data:
-        return jsonify({'error': 'Task list name is required'}), 400
-    
-    name = data['name'].strip()
-    if not name:
-        return jsonify({'error': 'Task list name cannot be empty'}), 400
+    task_list = db.get_or_404(TaskList, list_id)
+    try:
+        payload = TaskListIn.model_validate_json(request.get_data())
+    except ValidationError as error:
+        return validation_error(error)
     
     # Check if another task list with same name already exists
-    existing_list = TaskList.query.filter_by(name=name).first()
-    if existing_list and existing_list.id != list_id:
+    if name_taken(payload.name, exclude_id=list_id):
         return jsonify({'error': 'Task list with this name already exists'}), 400
     
-    task_list.name = name
-    task_list.description = data.get('description', '').strip()
-    task_list.updated_at = datetime.utcnow()
+    task_list.name = payload.name
+    task_list.description = payload.description
+    task_list.updated_at = utcnow()
     
     db.session.commit()
     
@@ -172,8 +407,8 @@ def update_task_list(list_id):
         'id': task_list.id,
         'name': task_list.name,
         'description': task_list.description,
-        'created_at': task_list.created_at.isoformat(),
-        'updated_at': task_list.updated_at.isoformat()
+        'created_at': task_list.created_at,
+        'updated_at': task_list.updated_at
     })
 
 @app.route('/api/task-lists/<int:list_id>', methods=['DELETE'])
@@ -181,11 +416,14 @@ def delete_task_list(list_id):
     """
     API endpoint to delete a task list and all its associated tasks.
     """
-    task_list = TaskList.query.get_or_404(list_id)
+    # The delete cascade needs the tasks, so load them up front
+    task_list = db.session.get(TaskList, list_id, options=[selectinload(TaskList.tasks)])
+    if task_list is None:
+        abort(404)
     db.session.delete(task_list)
     db.session.commit()
     
-    return jsonify({'message': 'Task list deleted successfully'})
+    return '', 204
 
 @app.route('/api/task-lists/<int:list_id>/tasks', methods=['POST'])
 def create_task(list_id):
@@ -193,21 +431,15 @@ def create_task(list_id):
     API endpoint to create a new task within a specific task list.
     Expects JSON data with 'title' and optional 'description'.
     """
-    task_list = TaskList.query.get_or_404(list_id)
-    data = request.get_json()
-    
-    if not data or 'title' not in data:
-        return jsonify({'error': 'Task title is required'}), 400
-    
-    title = data['title'].strip()
-    if not title:
-        return jsonify({'error': 'Task title cannot be empty'}), 400
-    
-    description = data.get('description', '').strip()
+    task_list = db.get_or_404(TaskList, list_id)
+    try:
+        payload = TaskIn.model_validate_json(request.get_data())
+    except ValidationError as error:
+        return validation_error(error)
     
     new_task = Task()
-    new_task.title = title
-    new_task.description = description
+    new_task.title = payload.title
+    new_task.description = payload.description
     new_task.task_list_id = list_id
     
     db.session.add(new_task)
@@ -218,32 +450,69 @@ def create_task(list_id):
         'title': new_task.title,
         'description': new_task.description,
         'completed': new_task.completed,
-        'created_at': new_task.created_at.isoformat(),
+        'created_at': new_task.created_at,
         'task_list_id': new_task.task_list_id
     }), 201
 
+@app.route('/api/task-lists/<int:list_id>/tasks/bulk', methods=['POST'])
+def create_tasks_bulk(list_id):
+    """
+    API endpoint to create many tasks in a task list with a single commit.
+    Expects JSON data with 'tasks', a list of objects with 'title' and optional 'description'.
+    """
+    db.get_or_404(TaskList, list_id)
+    try:
+        payload = TaskBulkIn.model_validate_json(request.get_data())
+    except ValidationError as error:
+        return validation_error(error)
+    
+    rows = [{
+        'title': item.title,
+        'description': item.description,
+        'task_list_id': list_id
+    } for item in payload.tasks]
+    
+    # One executemany INSERT and one commit instead of a unit of work per task
+    created = db.session.execute(
+        insert(Task).returning(
+            Task.id, Task.title, Task.description, Task.completed, Task.created_at,
+            sort_by_parameter_order=True
+        ),
+        rows
+    ).all()
+    db.session.commit()
+    
+    return jsonify([{
+        'id': task.id,
+        'title': task.title,
+        'description': task.description,
+        'completed': task.completed,
+        'created_at': task.created_at,
+        'task_list_id': list_id
+    } for task in created]), 201
+
 @app.route('/api/tasks/<int:task_id>', methods=['PUT'])
 def update_task(task_id):
     """
     API endpoint to update an existing task.
     Expects JSON data with 'title', 'description', and/or 'completed' status.
     """
-    task = Task.query.get_or_404(task_id)
-    data = request.get_json()
+    task = db.get_or_404(Task, task_id)
+    try:
+        payload = TaskUpdateIn.model_validate_json(request.get_data())
+    except ValidationError as error:
+        return validation_error(error)
     
-    if 'title' in data:
-        title = data['title'].strip()
-        if not title:
-            return jsonify({'error': 'Task title cannot be empty'}), 400
-        task.title = title
+    if payload.title is not None:
+        task.title = payload.title
     
-    if 'description' in data:
-        task.description = data['description'].strip()
+    if payload.description is not None:
+        task.description = payload.description
     
-    if 'completed' in data:
-        task.completed = bool(data['completed'])
+    if payload.completed is not None:
+        task.completed = payload.completed
     
-    task.updated_at = datetime.utcnow()
+    task.updated_at = utcnow()
     db.session.commit()
     
     return jsonify({
@@ -251,8 +520,8 @@ def update_task(task_id):
         'title': task.title,
         'description': task.description,
         'completed': task.completed,
-        'created_at': task.created_at.isoformat(),
-        'updated_at': task.updated_at.isoformat(),
+        'created_at': task.created_at,
+        'updated_at': task.updated_at,
         'task_list_id': task.task_list_id
     })
 
@@ -261,27 +530,70 @@ def delete_task(task_id):
     """
     API endpoint to delete a specific task.
     """
-    task = Task.query.get_or_404(task_id)
+    task = db.get_or_404(Task, task_id)
     db.session.delete(task)
     db.session.commit()
     
-    return jsonify({'message': 'Task deleted successfully'})
+    return '', 204
 
 @app.route('/api/tasks/<int:task_id>/toggle', methods=['POST'])
 def toggle_task(task_id):
     """
     API endpoint to toggle the completion status of a task.
     """
-    task = Task.query.get_or_404(task_id)
-    task.completed = not task.completed
-    task.updated_at = datetime.utcnow()
+    # Flip the flag in a single UPDATE ... RETURNING instead of load-then-update
+    task = db.session.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(completed=~Task.completed, updated_at=utcnow())
+        .returning(Task.id, Task.completed, Task.updated_at)
+    ).one_or_none()
+    if task is None:
+        abort(404)
     db.session.commit()
     
     return jsonify({
         'id': task.id,
         'completed': task.completed,
-        'updated_at': task.updated_at.isoformat()
+        'updated_at': task.updated_at
     })
 
+@app.route('/api/batch', methods=['POST'])
+def batch_tasks():
+    """
+    API endpoint to apply several task operations in a single transaction.
+    Expects JSON data with 'ops', a list of 'toggle' or 'update' operations
+    each naming a 'task_id'. Nothing is saved if any task does not exist.
+    """
+    try:
+        payload = BatchIn.model_validate_json(request.get_data())
+    except ValidationError as error:
+        return validation_error(error)
+    
+    results = []
+    for op in payload.ops:
+        if op.op == 'toggle':
+            values = {'completed': ~Task.completed}
+        else:
+            values = op.model_dump(include={'title', 'description', 'completed'}, exclude_none=True)
+        
+        task = db.session.execute(
+            update(Task)
+            .where(Task.id == op.task_id)
+            .values(updated_at=utcnow(), **values)
+            .returning(Task.id, Task.title, Task.description, Task.completed, Task.updated_at, Task.task_list_id)
+        ).one_or_none()
+        if task is None:
+            db.session.rollback()
+            return jsonify({'error': f'Task {op.task_id} not found'}), 404
+        results.append(task._asdict())
+    
+    # One commit for the whole batch instead of one per operation
+    db.session.commit()
+    
+    return jsonify(results)
+
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=4000)
+    with app.app_context():
+        init_db()
+    app.run(debug=app.debug, host='0.0.0.0', port=4000)
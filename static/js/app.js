@@ -95,7 +95,7 @@ async function loadTaskLists() {
     try {
         showLoading(taskListsContainer);
         
-        const response = await fetch('/api/task-lists');
+        const response = await fetch('/api/task-lists?fields=full');
         if (!response.ok) {
             throw new Error('Failed to load task lists');
         }